@@ -26,55 +26,55 @@ activities = {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     },
     "Soccer Team": {
         "description": "Join the school soccer team and compete in tournaments",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
         "max_participants": 22,
-        "participants": ["alex@mergington.edu"]
+        "participants": {"alex@mergington.edu"}
     },
     "Basketball Club": {
         "description": "Practice basketball skills and play friendly matches",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["sarah@mergington.edu", "james@mergington.edu"]
+        "participants": {"sarah@mergington.edu", "james@mergington.edu"}
     },
     "Art Studio": {
         "description": "Explore various art techniques including painting, drawing, and sculpture",
         "schedule": "Thursdays, 3:30 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["emily@mergington.edu"]
+        "participants": {"emily@mergington.edu"}
     },
     "Drama Club": {
         "description": "Develop acting skills and participate in school theater productions",
         "schedule": "Wednesdays and Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 25,
-        "participants": ["william@mergington.edu", "ava@mergington.edu"]
+        "participants": {"william@mergington.edu", "ava@mergington.edu"}
     },
     "Science Club": {
         "description": "Conduct experiments and explore scientific concepts through hands-on projects",
         "schedule": "Mondays, 3:30 PM - 4:30 PM",
         "max_participants": 18,
-        "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
+        "participants": {"lucas@mergington.edu", "mia@mergington.edu"}
     },
     "Debate Team": {
         "description": "Develop critical thinking and public speaking skills through competitive debates",
         "schedule": "Tuesdays, 4:00 PM - 5:30 PM",
         "max_participants": 16,
-        "participants": ["noah@mergington.edu"]
+        "participants": {"noah@mergington.edu"}
     }
 }
 
@@ -86,7 +86,12 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Participants are stored as sets; return them as sorted lists so the
+    # response is JSON-friendly and stable between requests
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -102,7 +107,7 @@ def signup_for_activity(activity_name: str, email: str):
     if email in activity["participants"]:
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
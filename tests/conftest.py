@@ -0,0 +1,60 @@
+"""
+Shared fixtures for the High School Management System API tests
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app, activities
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client for the FastAPI app, running its lifespan once"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def signup(client):
+    """Return a helper that POSTs a signup request for an activity"""
+    def _signup(activity, email):
+        return client.post(f"/activities/{activity}/signup", params={"email": email})
+    return _signup
+
+
+@pytest.fixture(scope="session")
+def unregister(client):
+    """Return a helper that DELETEs a participant from an activity"""
+    def _unregister(activity, email):
+        return client.delete(f"/activities/{activity}/unregister", params={"email": email})
+    return _unregister
+
+
+@pytest.fixture(scope="session")
+def activities_response(client):
+    """Fetch GET /activities once per session and return the parsed body"""
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="session")
+def original_participants():
+    """Snapshot the initial participants of every activity once per session"""
+    return {
+        name: frozenset(details["participants"])
+        for name, details in activities.items()
+    }
+
+
+@pytest.fixture
+def reset_activities(original_participants):
+    """Reset activities data after a test that mutates it"""
+    acts = activities
+    yield
+
+    # Restore original state after test
+    for name, participants in original_participants.items():
+        details = acts.get(name)
+        if details is not None:
+            details["participants"] = set(participants)
@@ -2,40 +2,9 @@
 Tests for the High School Management System API
 """
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
+from fastapi import HTTPException
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from app import app, activities
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        name: {
-            **details,
-            "participants": details["participants"].copy()
-        }
-        for name, details in activities.items()
-    }
-    
-    yield
-    
-    # Restore original state after test
-    for name, details in original_activities.items():
-        if name in activities:
-            activities[name]["participants"] = details["participants"].copy()
+from app import activities, signup_for_activity, unregister_from_activity
 
 
 class TestRootEndpoint:
@@ -51,26 +20,24 @@ class TestRootEndpoint:
 class TestGetActivities:
     """Tests for the GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client):
+    def test_get_activities_returns_all_activities(self, activities_response):
         """Test that GET /activities returns all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        data = response.json()
+        data = activities_response
         
         # Check that we have activities
         assert len(data) > 0
         
         # Check structure of first activity
-        first_activity = list(data.values())[0]
+        first_activity = next(iter(data.values()))
         assert "description" in first_activity
         assert "schedule" in first_activity
         assert "max_participants" in first_activity
         assert "participants" in first_activity
+        assert isinstance(first_activity["participants"], list)
     
-    def test_get_activities_includes_specific_activities(self, client):
+    def test_get_activities_includes_specific_activities(self, activities_response):
         """Test that specific activities are included"""
-        response = client.get("/activities")
-        data = response.json()
+        data = activities_response
         
         # Check for some expected activities
         assert "Chess Club" in data
@@ -80,70 +47,37 @@ class TestGetActivities:
 class TestSignupForActivity:
     """Tests for the POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_success(self, client):
-        """Test successful signup for an activity"""
-        email = "test@mergington.edu"
-        activity = "Chess Club"
-        
-        response = client.post(
-            f"/activities/{activity}/signup",
-            params={"email": email}
-        )
-        
-        assert response.status_code == 200
+    @pytest.mark.parametrize("activity,email,expected_status,expected_detail", [
+        ("Chess Club", "test@mergington.edu", 200, None),
+        ("Nonexistent Activity", "test@mergington.edu", 404, "Activity not found"),
+        # michael is already registered for Chess Club
+        ("Chess Club", "michael@mergington.edu", 400,
+         "Student already signed up for this activity"),
+    ], ids=["success", "nonexistent_activity", "duplicate"])
+    def test_signup(self, signup, reset_activities,
+                    activity, email, expected_status, expected_detail):
+        """Test signup outcomes for an activity"""
+        response = signup(activity, email)
+        
+        assert response.status_code == expected_status
         data = response.json()
-        assert "message" in data
+        if expected_detail is not None:
+            assert data["detail"] == expected_detail
+            return
+        
         assert email in data["message"]
         assert activity in data["message"]
         
         # Verify the participant was added
         assert email in activities[activity]["participants"]
     
-    def test_signup_for_nonexistent_activity(self, client):
-        """Test signup for an activity that doesn't exist"""
-        email = "test@mergington.edu"
-        activity = "Nonexistent Activity"
-        
-        response = client.post(
-            f"/activities/{activity}/signup",
-            params={"email": email}
-        )
-        
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Activity not found"
-    
-    def test_signup_duplicate_prevention(self, client):
-        """Test that a student cannot sign up twice for the same activity"""
-        email = "michael@mergington.edu"  # Already registered for Chess Club
-        activity = "Chess Club"
-        
-        response = client.post(
-            f"/activities/{activity}/signup",
-            params={"email": email}
-        )
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert data["detail"] == "Student already signed up for this activity"
-    
-    def test_signup_multiple_activities(self, client):
+    def test_signup_multiple_activities(self, reset_activities):
         """Test that a student can sign up for multiple different activities"""
         email = "newstudent@mergington.edu"
         
-        # Sign up for Chess Club
-        response1 = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
-        )
-        assert response1.status_code == 200
-        
-        # Sign up for Programming Class
-        response2 = client.post(
-            "/activities/Programming Class/signup",
-            params={"email": email}
-        )
-        assert response2.status_code == 200
+        # Sign up for Chess Club and Programming Class
+        signup_for_activity(activity_name="Chess Club", email=email)
+        signup_for_activity(activity_name="Programming Class", email=email)
         
         # Verify registered for both
         assert email in activities["Chess Club"]["participants"]
@@ -153,74 +87,42 @@ class TestSignupForActivity:
 class TestUnregisterFromActivity:
     """Tests for the DELETE /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_success(self, client):
-        """Test successful unregistration from an activity"""
-        email = "michael@mergington.edu"  # Already in Chess Club
-        activity = "Chess Club"
-        
-        # Verify initially registered
-        assert email in activities[activity]["participants"]
-        
-        response = client.delete(
-            f"/activities/{activity}/unregister",
-            params={"email": email}
-        )
-        
-        assert response.status_code == 200
+    @pytest.mark.parametrize("activity,email,expected_status,expected_detail", [
+        # michael is already registered for Chess Club
+        ("Chess Club", "michael@mergington.edu", 200, None),
+        ("Nonexistent Activity", "test@mergington.edu", 404, "Activity not found"),
+        ("Chess Club", "notregistered@mergington.edu", 400,
+         "Student is not registered for this activity"),
+    ], ids=["success", "nonexistent_activity", "not_registered"])
+    def test_unregister(self, unregister, reset_activities,
+                        activity, email, expected_status, expected_detail):
+        """Test unregister outcomes for an activity"""
+        response = unregister(activity, email)
+        
+        assert response.status_code == expected_status
         data = response.json()
-        assert "message" in data
+        if expected_detail is not None:
+            assert data["detail"] == expected_detail
+            return
+        
         assert email in data["message"]
         assert activity in data["message"]
         
         # Verify the participant was removed
         assert email not in activities[activity]["participants"]
     
-    def test_unregister_from_nonexistent_activity(self, client):
-        """Test unregister from an activity that doesn't exist"""
-        email = "test@mergington.edu"
-        activity = "Nonexistent Activity"
-        
-        response = client.delete(
-            f"/activities/{activity}/unregister",
-            params={"email": email}
-        )
-        
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Activity not found"
-    
-    def test_unregister_not_registered(self, client):
-        """Test unregister when student is not registered for the activity"""
-        email = "notregistered@mergington.edu"
-        activity = "Chess Club"
-        
-        response = client.delete(
-            f"/activities/{activity}/unregister",
-            params={"email": email}
-        )
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert data["detail"] == "Student is not registered for this activity"
-    
-    def test_unregister_and_resign_up(self, client):
+    def test_unregister_and_resign_up(self, signup, unregister, reset_activities):
         """Test that a student can re-sign up after unregistering"""
         email = "michael@mergington.edu"
         activity = "Chess Club"
         
         # Unregister
-        response1 = client.delete(
-            f"/activities/{activity}/unregister",
-            params={"email": email}
-        )
+        response1 = unregister(activity, email)
         assert response1.status_code == 200
         assert email not in activities[activity]["participants"]
         
         # Sign up again
-        response2 = client.post(
-            f"/activities/{activity}/signup",
-            params={"email": email}
-        )
+        response2 = signup(activity, email)
         assert response2.status_code == 200
         assert email in activities[activity]["participants"]
 
@@ -228,21 +130,26 @@ class TestUnregisterFromActivity:
 class TestActivityDataIntegrity:
     """Tests for data integrity across operations"""
     
-    def test_participant_count_accuracy(self, client):
+    def test_participant_count_accuracy(self, reset_activities):
         """Test that participant counts remain accurate after operations"""
         activity = "Chess Club"
         initial_count = len(activities[activity]["participants"])
         
         # Add a participant
-        client.post(
-            f"/activities/{activity}/signup",
-            params={"email": "new@mergington.edu"}
-        )
+        signup_for_activity(activity_name=activity, email="new@mergington.edu")
         assert len(activities[activity]["participants"]) == initial_count + 1
         
         # Remove a participant
-        client.delete(
-            f"/activities/{activity}/unregister",
-            params={"email": "new@mergington.edu"}
-        )
+        unregister_from_activity(activity_name=activity, email="new@mergington.edu")
         assert len(activities[activity]["participants"]) == initial_count
+    
+    def test_duplicate_signup_leaves_participants_unchanged(self, reset_activities):
+        """Test that a rejected duplicate signup does not modify participants"""
+        activity = "Chess Club"
+        initial_participants = set(activities[activity]["participants"])
+        
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity(activity_name=activity, email="michael@mergington.edu")
+        
+        assert exc_info.value.status_code == 400
+        assert activities[activity]["participants"] == initial_participants